@@ -21,7 +21,6 @@ Defines the file processing chain model `dsp`.
 import os
 import tqdm
 import logging
-import webbrowser
 import os.path as osp
 import schedula as sh
 from co2mpas._version import *
@@ -52,6 +51,17 @@ def init_conf(inputs):
 dsp.add_data(sh.START, filters=[init_conf, lambda x: sh.NONE])
 
 
+def _package_file(*paths):
+    return osp.join(osp.dirname(__file__), *paths)
+
+
+def _copy_files(src, dst):
+    from shutil import copy2
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(8, len(src) or 1)) as executor:
+        list(executor.map(copy2, src, dst))
+
+
 @sh.add_function(dsp, outputs=['demo'])
 def save_demo_files(output_folder):
     """
@@ -62,11 +72,9 @@ def save_demo_files(output_folder):
     :type output_folder: str
     """
     import glob
-    from shutil import copy2
-    from pkg_resources import resource_filename
     os.makedirs(output_folder or '.', exist_ok=True)
-    for src in glob.glob(resource_filename('co2mpas', 'demos/*.xlsx')):
-        copy2(src, osp.join(output_folder, osp.basename(src)))
+    src = glob.glob(_package_file('demos', '*.xlsx'))
+    _copy_files(src, [osp.join(output_folder, osp.basename(fp)) for fp in src])
     log.info('CO2MPAS demos written into (%s).', output_folder)
 
 
@@ -83,13 +91,9 @@ def save_co2mpas_template(output_file, template_type):
         Template type.
     :type template_type: str
     """
-    from shutil import copy2
-    from pkg_resources import resource_filename
-    src = resource_filename(
-        'co2mpas', 'templates/%s_template.xlsx' % template_type
-    )
+    src = _package_file('templates', '%s_template.xlsx' % template_type)
     os.makedirs(osp.dirname(output_file) or '.', exist_ok=True)
-    copy2(src, output_file)
+    _copy_files([src], [output_file])
     log.info('CO2MPAS input template written into (%s).', output_file)
 
 
@@ -195,6 +199,7 @@ def run_sitemap(sitemap, cache_folder, host, port):
     """
     import flask
     import datetime
+    import webbrowser
     import numpy as np
     flask.Flask.send_file_max_age_default = datetime.timedelta(seconds=0)
     np.set_printoptions(threshold=np.inf)
@@ -221,7 +226,6 @@ def wait_site(site):
 def _yield_files(*paths, cache=None, ext=(
         'co2mpas.ta', 'dice.ta', 'jet.ta', 'co2mpas', 'xlsx', 'dill', 'xls'
 )):
-    import glob
     cache = set() if cache is None else cache
     for path in paths:
         path = osp.abspath(path)
@@ -229,9 +233,12 @@ def _yield_files(*paths, cache=None, ext=(
             continue
         cache.add(path)
         if osp.isdir(path):
-            yield from _yield_files(
-                *filter(osp.isfile, glob.glob(osp.join(path, '*'))), cache=cache
-            )
+            with os.scandir(path) as it:
+                files = [
+                    e.path for e in it
+                    if not e.name.startswith('.') and e.is_file()
+                ]
+            yield from _yield_files(*files, cache=cache)
         elif osp.isfile(path) and path.lower().endswith(ext):
             yield path
         else:
@@ -16,19 +16,17 @@ import os
 import click
 import logging
 import click_log
+import importlib
 import schedula as sh
 import os.path as osp
 from co2mpas import dsp as _process
 from co2mpas._version import __version__
 
-try:
-    from co2mpas.cli.sync import cli as _sync
-except ImportError:
-    _sync = None
-try:  # TODO: to be changed to co2mpas_gui.
-    from co2wui.cli import cli as _gui
-except ImportError:
-    _gui = None
+#: Optional sub-commands as `{name: (required package, cli module)}`.
+_lazy_commands = {
+    'syncing': ('syncing', 'co2mpas.cli.sync'),
+    'gui': ('co2wui', 'co2wui.cli')  # TODO: to be changed to co2mpas_gui.
+}
 
 log = logging.getLogger('co2mpas.cli')
 CO2MPAS_HOME = os.environ.get('CO2MPAS_HOME', '.')
@@ -51,8 +49,34 @@ logger = _Logger('cli')
 click_log.basic_config(logger)
 
 
+class _Group(click.Group):
+    """
+    Click group that imports the optional sub-commands only when invoked.
+    """
+
+    # noinspection PyMissingOrEmptyDocstring
+    def list_commands(self, ctx):
+        from importlib.util import find_spec
+        cmds = set(super(_Group, self).list_commands(ctx))
+        cmds.update(
+            k for k, (pkg, _) in _lazy_commands.items() if find_spec(pkg)
+        )
+        return sorted(cmds)
+
+    # noinspection PyMissingOrEmptyDocstring
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in _lazy_commands:
+            try:
+                mod = importlib.import_module(_lazy_commands[cmd_name][1])
+            except ImportError:
+                return None
+            self.add_command(mod.cli, cmd_name)
+        return super(_Group, self).get_command(ctx, cmd_name)
+
+
 @click.group(
-    'co2mpas', context_settings=dict(help_option_names=['-h', '--help'])
+    'co2mpas', cls=_Group,
+    context_settings=dict(help_option_names=['-h', '--help'])
 )
 @click.version_option(__version__)
 def cli():
@@ -226,11 +250,5 @@ def run(input_files, cache_folder, host, port, plot_workflow, **kwargs):
     return _process(inputs, ['plot', 'done', 'run'])
 
 
-if _sync is not None:
-    cli.add_command(_sync, 'syncing')
-
-if _gui is not None:
-    cli.add_command(_gui, 'gui')
-
 if __name__ == '__main__':
     cli()
@@ -9,13 +9,14 @@ It provides CO2MPAS schema parse/validator.
 """
 
 import re
+import ast
+import copy
 import pprint
 import logging
 import functools
 import numpy as np
 import os.path as osp
 import schedula as sh
-import co2mpas.utils as co2_utl
 from collections import OrderedDict
 from collections.abc import Iterable
 from schema import Schema, Use, And, Or, SchemaError
@@ -35,12 +36,24 @@ def _format_error(error):
 
 # noinspection PyMissingOrEmptyDocstring
 class Empty:
+    __slots__ = ()
+
     def __repr__(self):
-        return '%s' % self.__class__.__name__
+        return 'Empty'
 
     @staticmethod
-    def validate(data):
-        if isinstance(data, str) and data == 'EMPTY':
+    def parse(data):
+        if data is None:
+            return sh.NONE
+
+        cls = type(data)
+        if cls is str:
+            if data == 'EMPTY':
+                return sh.EMPTY
+            return None if data else sh.NONE
+        elif cls is float or cls is int or cls is bool:
+            return None  # Numbers (zero and nan too) are never empty.
+        elif isinstance(data, str) and data == 'EMPTY':
             return sh.EMPTY
 
         try:
@@ -50,11 +63,91 @@ class Empty:
 
         if empty:
             return sh.NONE
-        else:
+
+    @staticmethod
+    def validate(data):
+        res = Empty.parse(data)
+        if res is None:
             raise SchemaError('%r is not empty' % data)
+        return res
+
+
+_empty = Empty()
+
+
+def _is_none(x):
+    return x is sh.NONE
+
+
+_write_check = Or(_is_none, Use(str))
+
+
+# noinspection PyMissingOrEmptyDocstring
+class _Field:
+    """
+    Validator equivalent to `Or(Empty(), schema)`.
+
+    It checks the empty values without raising and it validates the others
+    directly with `schema` (converting the result to `str` when writing). The
+    full `schema` tree is used only to build the error message of invalid
+    data.
+    """
+    __slots__ = 'schema', 'full', 'read'
+
+    def __init__(self, schema, read=True):
+        self.full = Or(_empty, schema)
+        if not read:
+            self.full = And(self.full, _write_check)
+        self.schema, self.read = schema, read
+
+    def validate(self, data):
+        try:
+            empty = Empty.parse(data)
+        except Exception:
+            empty = None
+        if empty is None:
+            try:
+                res = self.schema.validate(data)
+                return res if self.read or res is sh.NONE else str(res)
+            except Exception:
+                pass
+        elif self.read or empty is sh.NONE:
+            return empty
+        return self.full.validate(data)
+
+
+@functools.lru_cache(None)
+def _field(schema, read=True):
+    return _Field(schema, read=read)
+
+
+# noinspection PyMissingOrEmptyDocstring
+class _Lazy:
+    """
+    Schema built by `factory(**kwargs)` when it is used the first time.
+
+    It defers the imports needed by the model-type schemas until a field that
+    needs them is actually validated.
+    """
+    __slots__ = 'factory', 'kwargs', 'schema'
+
+    def __init__(self, factory, **kwargs):
+        self.factory, self.kwargs, self.schema = factory, kwargs, None
+
+    def __repr__(self):
+        return repr(self.build())
+
+    def build(self):
+        if self.schema is None:
+            self.schema = self.factory(**self.kwargs)
+        return self.schema
+
+    def validate(self, data, **kwargs):
+        return self.build().validate(data, **kwargs)
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _function(error=None, read=True, **kwargs):
     def _check_function(f):
         assert callable(f)
@@ -67,36 +160,81 @@ def _function(error=None, read=True, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _string(error=None, **kwargs):
     error = _format_error(error or 'should be a string!')
     return Use(str, error=error)
 
 
+# noinspection PyMissingOrEmptyDocstring
+class _Select:
+    __slots__ = 'types',
+
+    def __init__(self, types):
+        self.types = {k.lower(): k for k in types}
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, tuple(self.types.values()))
+
+    def __call__(self, x):
+        return self.types[x.lower()]
+
+
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _select(types=(), error=None, **kwargs):
     error = _format_error(error or 'should be one of {}!'.format(types))
-    types = {k.lower(): k for k in types}
-    return And(str, Use(lambda x: types[x.lower()]), error=error)
+    return Use(_Select(types), error=error)
 
 
 def _check_positive(x):
     return x >= 0
 
 
+def _check_greater_than_zero(x):
+    return x > 0
+
+
+def _check_between_zero_and_one(x):
+    return 0 <= x <= 1
+
+
+def _check_greater_than_one(x):
+    return x >= 1
+
+
 # noinspection PyUnusedLocal,PyShadowingBuiltins
+@functools.lru_cache(None)
 def _positive(type=float, error=None, check=_check_positive, **kwargs):
     error = _format_error(error or 'should be as {} and positive!'.format(type))
     return And(Use(type), check, error=error)
 
 
+# noinspection PyMissingOrEmptyDocstring
+class _CheckLimits:
+    __slots__ = 'limits',
+
+    def __init__(self, limits):
+        self.limits = tuple(limits)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.limits)
+
+    def __hash__(self):
+        return hash(self.limits)
+
+    def __eq__(self, other):
+        return isinstance(other, _CheckLimits) and self.limits == other.limits
+
+    def __call__(self, x):
+        return self.limits[0] <= x <= self.limits[1]
+
+
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _limits(limits=(0, 100), error=None, **kwargs):
     error = _format_error(error or 'should be {} <= x <= {}!'.format(*limits))
-
-    def _check_limits(x):
-        return limits[0] <= x <= limits[1]
-
-    return And(Use(float), _check_limits, error=error)
+    return And(Use(float), _CheckLimits(limits), error=error)
 
 
 _usersyms = {
@@ -104,13 +242,31 @@ _usersyms = {
 }
 
 
+@functools.lru_cache(None)
+def _interpreter(usersyms):
+    from asteval import Interpreter
+    return Interpreter(usersyms=dict(usersyms))
+
+
 # noinspection PyUnusedLocal
 def _eval(s, error=None, usersyms=None, **kwargs):
     error = _format_error(error or 'cannot be eval!')
-    from asteval import Interpreter
     usersyms = sh.combine_dicts(_usersyms, usersyms or {})
-    return Or(And(str, Use(Interpreter(usersyms=usersyms).eval), s), s,
-              error=error)
+    usersyms = tuple(sorted(usersyms.items()))
+
+    def _eval_str(expr):
+        try:
+            return ast.literal_eval(expr)
+        except Exception:  # Not a plain literal.
+            return _interpreter(usersyms).eval(expr)
+
+    return Or(And(str, Use(_eval_str), s), s, error=error)
+
+
+def _drop_none(x):
+    if not isinstance(x, dict):
+        x = dict(x)
+    return {k: v for k, v in x.items() if v is not None}
 
 
 # noinspection PyUnusedLocal,PyShadowingBuiltins
@@ -118,9 +274,9 @@ def _dict(format=None, error=None, read=True, pformat=pprint.pformat, **kwargs):
     format = And(dict, format or {int: float})
     error = error or 'should be a dict with this format {}!'.format(format)
     error = _format_error(error)
-    c = Use(lambda x: {k: v for k, v in dict(x).items() if v is not None})
+    c = Use(_drop_none)
     if read:
-        return _eval(Or(Empty(), And(c, Or(Empty(), format))), error=error)
+        return _eval(Or(_empty, And(c, Or(_empty, format))), error=error)
     else:
         return And(_dict(format=format, error=error), Use(pformat))
 
@@ -133,25 +289,37 @@ def _ordict(format=None, error=None, read=True, **kwargs):
     c = Use(OrderedDict)
     if read:
         return _eval(
-            Or(Empty(), And(c, Or(Empty(), format))), error=error,
+            Or(_empty, And(c, Or(_empty, format))), error=error,
             usersyms={'OrderedDict': OrderedDict}
         )
     else:
         return And(_dict(format=format, error=error), Use(pprint.pformat))
 
 
-def _check_length(length):
-    if not isinstance(length, Iterable):
-        length = (length,)
+# noinspection PyMissingOrEmptyDocstring
+class _CheckLength:
+    __slots__ = 'length',
+
+    def __init__(self, length):
+        if not isinstance(length, Iterable):
+            length = (length,)
+        self.length = tuple(length)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.length)
+
+    def __hash__(self):
+        return hash(self.length)
 
-    def _check(data):
-        ld = len(data)
-        return any(ld == l for l in length)
+    def __eq__(self, other):
+        return isinstance(other, _CheckLength) and self.length == other.length
 
-    return _check
+    def __call__(self, data):
+        return len(data) in self.length
 
 
 # noinspection PyUnusedLocal,PyShadowingBuiltins
+@functools.lru_cache(None)
 def _type(type=None, error=None, length=None, **kwargs):
     type = type or tuple
     usersyms = {getattr(type, '__name__', 'type'): type}
@@ -161,7 +329,7 @@ def _type(type=None, error=None, length=None, **kwargs):
                 type, length
             )
         )
-        return And(_type(type=type), _check_length(length), error=error)
+        return And(_type(type=type), _CheckLength(length), error=error)
     if not isinstance(type, (Use, Schema, And, Or)):
         type = Or(type, Use(type))
     error = _format_error(error or 'should be as {}!'.format(type))
@@ -169,6 +337,7 @@ def _type(type=None, error=None, length=None, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _index_dict(error=None, **kwargs):
     error = error or 'cannot be parsed as {}!'.format({int: float})
     error = _format_error(error)
@@ -189,20 +358,28 @@ def _np_array2list(x):
     return r.tolist()
 
 
+def _asarray(x, dtype=float, ravel=False):
+    if isinstance(x, list) and x and isinstance(x[0], (int, float)):
+        try:  # Flat list of numbers.
+            return np.fromiter(x, dtype=dtype, count=len(x))
+        except (TypeError, ValueError):
+            pass
+    x = np.asarray(x, dtype=dtype)
+    return x.ravel() if ravel else x
+
+
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _np_array(dtype=None, error=None, read=True, ravel=True, **kwargs):
     dtype = dtype or float
     error = _format_error(
         error or 'cannot be parsed as np.array dtype={}!'.format(dtype)
     )
     if read:
-        if ravel:
-            c = Use(lambda x: np.asarray(x, dtype=dtype).ravel())
-        else:
-            c = Use(lambda x: np.asarray(x, dtype=dtype))
+        c = Use(functools.partial(_asarray, dtype=dtype, ravel=ravel))
         return Or(And(str, _eval(
             c, usersyms={'np.array': np.array}
-        )), c, And(_type(), c), Empty(), error=error)
+        )), c, And(_type(), c), _empty, error=error)
     else:
         return And(_np_array(dtype=dtype), Use(_np_array2list), error=error)
 
@@ -216,10 +393,21 @@ def _check_np_array_positive(x):
     :return:
     """
     # noinspection PyUnresolvedReferences
-    return (x >= 0).all()
+    return not x.size or x.min() >= 0
+
+
+def _check_np_array_sorted(x):
+    # noinspection PyUnresolvedReferences
+    return (x[:-1] <= x[1:]).all()
+
+
+def _check_np_array_greater_than_minus_one(x):
+    # noinspection PyUnresolvedReferences
+    return not x.size or x.min() >= -1
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _np_array_positive(dtype=None, error=None, read=True,
                        check=_check_np_array_positive, ravel=True, **kwargs):
     dtype = dtype or float
@@ -229,13 +417,11 @@ def _np_array_positive(dtype=None, error=None, read=True,
     )
     if read:
         c = And(
-            Use(lambda x: np.asarray(x, dtype=dtype)),
-            Use(lambda x: x.ravel() if ravel else x),
-            check
+            Use(functools.partial(_asarray, dtype=dtype, ravel=ravel)), check
         )
         return Or(And(str, _eval(
             c, usersyms={'np.array': np.array}
-        )), c, And(_type(), c), Empty(), error=error)
+        )), c, And(_type(), c), _empty, error=error)
     else:
         return And(
             _np_array_positive(dtype=dtype), Use(lambda x: x.tolist()),
@@ -244,6 +430,7 @@ def _np_array_positive(dtype=None, error=None, read=True,
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _alternator_current_model(error=None, read=True, **kwargs):
     error = _format_error(error)
     if read:
@@ -255,6 +442,7 @@ def _alternator_current_model(error=None, read=True, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _service_battery_status_model(error=None, read=True, **kwargs):
     error = _format_error(error)
     if read:
@@ -268,6 +456,7 @@ def _service_battery_status_model(error=None, read=True, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _engine_temperature_regression_model(error=None, read=True, **kwargs):
     error = _format_error(error)
     if read:
@@ -281,6 +470,7 @@ def _engine_temperature_regression_model(error=None, read=True, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _fmep_model(error=None, read=True, **kwargs):
     error = _format_error(error)
     if read:
@@ -290,6 +480,7 @@ def _fmep_model(error=None, read=True, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _cmv(error=None, **kwargs):
     error = _format_error(error)
     from ..model.physical.gear_box.at_gear.cmv import CMV
@@ -297,6 +488,7 @@ def _cmv(error=None, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _mvl(error=None, **kwargs):
     error = _format_error(error)
     from ..model.physical.gear_box.at_gear import MVL
@@ -304,6 +496,7 @@ def _mvl(error=None, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _gspv(error=None, **kwargs):
     error = _format_error(error)
     from ..model.physical.gear_box.at_gear.gspv import GSPV
@@ -311,6 +504,7 @@ def _gspv(error=None, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _gsch(error=None, **kwargs):
     error = _format_error(error)
     from ..model.physical.gear_box.at_gear.gspv_ch import GSMColdHot
@@ -318,6 +512,7 @@ def _gsch(error=None, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _dtc(error=None, read=True, **kwargs):
     error = _format_error(error)
     if read:
@@ -327,6 +522,7 @@ def _dtc(error=None, read=True, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _cvt(error=None, read=True, **kwargs):
     error = _format_error(error)
     if read:
@@ -335,36 +531,43 @@ def _cvt(error=None, read=True, **kwargs):
     return And(_dtc(), Use(lambda x: sh.NONE), error=error)
 
 
+@functools.lru_cache(None)
+def _import(module, name):
+    import importlib
+    return getattr(importlib.import_module(module), name)
+
+
 def _parameters2str(data):
-    from lmfit import Parameters
-    if isinstance(data, Parameters):
+    if isinstance(data, _import('lmfit', 'Parameters')):
         return data.dumps(sort_keys=True)
 
 
+@functools.lru_cache(256)
+def _loads_parameters(data):
+    p = _import('lmfit', 'Parameters')()
+    p.loads(data)
+    return p
+
+
 def _str2parameters(data):
     if isinstance(data, str):
-        from lmfit import Parameters
-        p = Parameters()
-        p.loads(data)
-        return p
+        # Parameters are mutable, hence return a copy of the cached ones.
+        return copy.deepcopy(_loads_parameters(data))
     return data
 
 
+@functools.lru_cache(None)
 def _parameters(error=None, read=True):
     error = _format_error(error)
     if read:
-        from lmfit import Parameters
-        return And(Use(_str2parameters), _type(type=Parameters, error=error))
+        parameters = _import('lmfit', 'Parameters')
+        return And(Use(_str2parameters), _type(type=parameters, error=error))
     else:
         return And(_parameters(), Use(_parameters2str), error=error)
 
 
 # noinspection PyUnusedLocal
-def _compare_str(s, **kwargs):
-    return And(Use(str.lower), s.lower(), Use(lambda x: s))
-
-
-# noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _tyre_code(error=None, **kwargs):
     error = error or 'invalid tyre code!'
     error = _format_error(error)
@@ -372,13 +575,16 @@ def _tyre_code(error=None, **kwargs):
     from ..model.physical.wheels import (
         _re_tyre_code_iso, _re_tyre_code_numeric, _re_tyre_code_pax
     )
-    return And(str, Or(
-        _re_tyre_code_iso.match, _re_tyre_code_numeric.match,
-        _re_tyre_code_pax.match
-    ), error=error)
+    import regex
+    patterns = _re_tyre_code_iso, _re_tyre_code_numeric, _re_tyre_code_pax
+    match = regex.compile('|'.join(
+        '(?:%s)' % r.pattern for r in patterns
+    ), _re_tyre_code_iso.flags).match
+    return And(str, match, error=error)
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _tyre_dimensions(error=None, **kwargs):
     error = error or 'invalid format for tyre dimensions!'
     error = _format_error(error)
@@ -400,17 +606,20 @@ def check_phases_separated(x):
     >>> [check_phases_separated(x) for x in bags]
     [False, False, True, True, True, True]
     """
-    if not len(x):
+    x = np.asarray(x)
+    if x.size < 2:
         return True
 
-    x = np.asarray(x)
-    # noinspection PyUnresolvedReferences
-    deduped_count = 1 + (x[1:] != x[:-1]).sum()  # [3,3,1,1,3] --> len([3,1,3])
+    runs = np.empty(x.shape, bool)
+    runs[0] = True
+    np.not_equal(x[1:], x[:-1], out=runs[1:])
+    runs = x[runs]  # [3,3,1,1,3] --> [3,1,3]
 
-    return deduped_count == np.unique(x).size
+    return np.unique(runs).size == runs.size
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _bag_phases(error=None, read=True, **kwargs):
     er = 'Phases must be separated!'
     error = _format_error(error)
@@ -422,6 +631,7 @@ def _bag_phases(error=None, read=True, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _file(error=None, **kwargs):
     er = 'Must be a file!'
     error = _format_error(error)
@@ -429,6 +639,7 @@ def _file(error=None, **kwargs):
 
 
 # noinspection PyUnusedLocal
+@functools.lru_cache(None)
 def _dir(error=None, **kwargs):
     er = 'Must be a directory!'
     error = _format_error(error)
@@ -439,17 +650,15 @@ def _dir(error=None, **kwargs):
     return And(_string(), Schema(_fun, error=er), error=error)
 
 
-def _is_sorted(iterable, key=lambda a, b: a <= b):
-    return all(key(a, b) for a, b in co2_utl.pairwise(iterable))
-
-
 def _validator(schema, convert, default, k, v):
-    if k in schema:
-        default = schema[k]
-    elif k.lower() in convert:
-        k = convert[k.lower()]
-        default = schema[k]
-    return k, default.validate(v)
+    validator = schema.get(k)
+    if validator is None:
+        alias = convert.get(k.lower())
+        if alias is None:
+            validator = default
+        else:
+            k, validator = alias, schema[alias]
+    return k, validator.validate(v)
 
 
 # noinspection PyUnresolvedReferences
@@ -466,29 +675,29 @@ def define_data_validation(read=True):
         Data schema.
     :rtype: function
     """
-    cmv = _cmv(read=read)
-    dtc = _dtc(read=read)
-    cvt = _cvt(read=read)
-    gspv = _gspv(read=read)
-    gsch = _gsch(read=read)
+    cmv = _Lazy(_cmv, read=read)
+    dtc = _Lazy(_dtc, read=read)
+    cvt = _Lazy(_cvt, read=read)
+    gspv = _Lazy(_gspv, read=read)
+    gsch = _Lazy(_gsch, read=read)
     string = _string(read=read)
     positive = _positive(read=read)
     greater_than_zero = _positive(
         read=read, error='should be as <float> and greater than zero!',
-        check=lambda x: x > 0
+        check=_check_greater_than_zero
     )
     between_zero_and_one = _positive(
         read=read, error='should be as <float> and between zero and one!',
-        check=lambda x: 0 <= x <= 1
+        check=_check_between_zero_and_one
     )
     greater_than_one = _positive(
         read=read, error='should be as <float> and greater than one!',
-        check=lambda x: x >= 1
+        check=_check_greater_than_one
     )
     positive_int = _positive(type=int, read=read)
     greater_than_one_int = _positive(
         type=int, read=read, error='should be as <int> and greater than one!',
-        check=lambda x: x >= 1
+        check=_check_greater_than_one
     )
     limits = _limits(read=read)
     index_dict = _index_dict(read=read)
@@ -496,12 +705,12 @@ def define_data_validation(read=True):
     np_array_sorted = _np_array_positive(
         read=read, error='cannot be parsed because it should be an '
                          'np.array dtype=<float> with ascending order!',
-        check=_is_sorted
+        check=_check_np_array_sorted
     )
     np_array_greater_than_minus_one = _np_array_positive(
         read=read, error='cannot be parsed because it should be an '
                          'np.array dtype=<float> and all values >= -1!',
-        check=lambda x: (x >= -1).all()
+        check=_check_np_array_greater_than_minus_one
     )
     np_array_bool = _np_array(dtype=bool, read=read)
     np_array_int = _np_array(dtype=int, read=read)
@@ -518,11 +727,11 @@ def define_data_validation(read=True):
     tuplefloat = _type(type=And(_tuple, (_type(float),)), read=read)
     dictstrdict = _dict(format={str: dict}, read=read)
     ordictstrdict = _ordict(format={str: dict}, read=read)
-    parameters = _parameters(read=read)
+    parameters = _Lazy(_parameters, read=read)
     dictstrfloat = _dict(format={str: Use(float)}, read=read)
     dictarray = _dict(format={str: np_array}, read=read)
-    tyre_code = _tyre_code(read=read)
-    tyre_dimensions = _tyre_dimensions(read=read)
+    tyre_code = _Lazy(_tyre_code, read=read)
+    tyre_dimensions = _Lazy(_tyre_dimensions, read=read)
     maximum_velocity_range = _select(
         types=tuple(map(str, range(151))) + ('>150',), read=read
     )
@@ -562,7 +771,7 @@ def define_data_validation(read=True):
         'DTGS': dtc,
         'GSPV': gspv,
         'GSPV_Cold_Hot': gsch,
-        'MVL': _mvl(read=read),
+        'MVL': _Lazy(_mvl, read=read),
         'engine_n_cylinders': positive_int,
         'lock_up_tc_limits': tuplefloat2,
         'ki_multiplicative': greater_than_one,
@@ -696,10 +905,13 @@ def define_data_validation(read=True):
         'transition_cycle_index': positive_int,
         'alternator_charging_currents': tuplefloat2,
         'relative_electric_energy_change': tuplefloat,
-        'alternator_current_model': _alternator_current_model(read=read),
-        'dcdc_current_model': _alternator_current_model(read=read),
-        'service_battery_status_model': _service_battery_status_model(
-            read=read),
+        'alternator_current_model': _Lazy(
+            _alternator_current_model, read=read
+        ),
+        'dcdc_current_model': _Lazy(_alternator_current_model, read=read),
+        'service_battery_status_model': _Lazy(
+            _service_battery_status_model, read=read
+        ),
         'clutch_speed_model': function,
         'co2_emissions_model': function,
         'co2_error_function_on_emissions': function,
@@ -727,7 +939,7 @@ def define_data_validation(read=True):
         'service_battery_load': tuplefloat2,
         'engine_thermostat_temperature_window': tuplefloat2,
         'engine_temperature_regression_model':
-            _engine_temperature_regression_model(read=read),
+            _Lazy(_engine_temperature_regression_model, read=read),
         'engine_type': string,
         'input_type': string,
         'starter_model': function,
@@ -737,7 +949,7 @@ def define_data_validation(read=True):
         'motor_p2_planetary_maximum_power_function': function,
         'start_stop_hybrid_params': dictstrfloat,
         'full_load_curve': function,
-        'fmep_model': _fmep_model(read=read),
+        'fmep_model': _Lazy(_fmep_model, read=read),
         'gear_box_efficiency_constants': dictstrdict,
         'gear_box_efficiency_parameters_cold_hot': dictstrdict,
         'scores': dictstrdict,
@@ -825,16 +1037,13 @@ def define_data_validation(read=True):
     except ImportError:
         pass
 
-    schema = {k: Or(Empty(), v) for k, v in schema.items()}
-    schema[sh.NONE] = Or(_float, np_array)
+    schema = {k: _field(v, read=read) for k, v in schema.items()}
+    default = Or(_float, np_array)
 
     if not read:
-        def _f(x):
-            return x is sh.NONE
-
-        schema = {k: And(v, Or(_f, Use(str))) for k, v in schema.items()}
+        default = And(default, _write_check)
 
-    return functools.partial(_validator, schema, convert, schema.pop(sh.NONE))
+    return functools.partial(_validator, schema, convert, default)
 
 
 def _input_version(error=None, read=True, **kwargs):
@@ -898,12 +1107,5 @@ def define_flags_validation(read=True):
         'output_folder': isdir,
     }
 
-    schema = {k: Or(Empty(), v) for k, v in schema.items()}
-
-    if not read:
-        def _f(x):
-            return x is sh.NONE
-
-        schema = {k: And(v, Or(_f, Use(str))) for k, v in schema.items()}
-
+    schema = {k: _field(v, read=read) for k, v in schema.items()}
     return functools.partial(_validator, schema, {k: k for k in schema}, None)
@@ -284,10 +284,29 @@ def wltp_velocities(
     else:
         v = class_velocities
 
+    # The class cycle is repeated to cover `times`. Since `class_times` is a
+    # uniform grid, the repeated profile is interpolated by index arithmetic.
+    period = class_times.shape[0] - 1
     n = int(np.ceil(times[-1] / class_times[-1]))
-    t = np.cumsum(np.tile(np.ediff1d(class_times, to_begin=[0]), (n,)))
-    t += class_times[0]
-    return np.interp(times, t, np.tile(v, (n,)))
+    dt = (class_times[-1] - class_times[0]) / period
+    x = np.clip((np.asarray(times, float) - class_times[0]) / dt, 0, n * period)
+    if np.array_equal(x, np.arange(x.shape[0])):  # Times on the class grid.
+        res = np.resize(v[:-1], x.shape[0])
+        if x.shape[0] - 1 == n * period:
+            res[-1] = v[-1]
+        return res
+    i = x.astype(int)
+    if np.array_equal(i, x):  # Integer times, no interpolation is needed.
+        res = v[i % period]
+        res[i == n * period] = v[-1]
+        return res
+    i = np.minimum(i, n * period - 1)
+    x -= i
+    i %= period
+    res = np.diff(v)[i]
+    res *= x
+    res += v[i]
+    return res
 
 
 dsp.add_function(
@@ -24,7 +24,6 @@ Sub-Modules:
 """
 
 import copy
-import itertools
 import collections
 import numpy as np
 import schedula as sh
@@ -63,21 +62,18 @@ class MVL(CMV):
         self.velocity_speed_ratios = velocity_speed_ratios
         idle = idle_engine_speed
         mvl = [np.array([idle[0] - idle[1], idle[0] + idle[1]])]
-        for k in range(1, int(max(gears)) + 1):
-            lm, on, vsr = [], None, velocity_speed_ratios[k]
-
-            for i, b in enumerate(itertools.chain(gears == k, [False])):
-                if not b and on is not None:
-                    v = velocities[on:i]
-                    lm.append([min(v), max(v)])
-                    on = None
 
-                elif on is None and b:
-                    on = i
+        # Velocity bounds of each run of constant gear.
+        gears = np.asarray(gears)
+        starts = np.append(0, np.flatnonzero(np.diff(gears)) + 1)
+        run_gears = gears[starts]
+        min_vel = np.minimum.reduceat(velocities, starts)
+        max_vel = np.maximum.reduceat(velocities, starts)
 
-            if lm:
-                min_v, max_v = zip(*lm)
-                lm = [sum(co2_utl.reject_outliers(min_v)), max(max_v)]
+        for k in range(1, int(max(gears)) + 1):
+            b, vsr = run_gears == k, velocity_speed_ratios[k]
+            if b.any():
+                lm = sum(co2_utl.reject_outliers(min_vel[b])), max(max_vel[b])
                 mvl.append(np.array([max(idle[0], l / vsr) for l in lm]))
             else:
                 mvl.append(mvl[-1].copy())
@@ -161,6 +157,7 @@ class CorrectGear:
     def __init__(self, velocity_speed_ratios=None, idle_engine_speed=None):
         velocity_speed_ratios = velocity_speed_ratios or {}
         self.gears = np.array(sorted(k for k in velocity_speed_ratios if k > 0))
+        self.gears_index = {k: j for j, k in enumerate(self.gears)}
         self.vsr = velocity_speed_ratios
         self.min_gear = velocity_speed_ratios and self.gears[0] or None
         self.idle_engine_speed = idle_engine_speed
@@ -216,13 +213,14 @@ class CorrectGear:
         if vel > self.max_velocity_full_load_corr or gear <= self.min_gear:
             return gear
 
-        j = np.searchsorted(self.gears, gear)
+        j = self.gears_index.get(gear)
+        if j is None:
+            j = np.searchsorted(self.gears, gear)
         delta = self.flc(vel / self.np_vsr) - motive_powers[i]
-        valid = delta[:j + 1][::-1] >= 0
-        k = valid.argmax()
-        if not valid[k]:
+        valid = np.flatnonzero(delta[:j + 1] >= 0)
+        if not valid.size:
             return self.gears[np.argmax(delta)]
-        return self.gears[j - k]
+        return self.gears[valid[-1]]
 
     def fit_correct_driveability_rules(self, engine_speed_at_max_power):
         idle = self.idle_engine_speed[0]